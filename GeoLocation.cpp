@@ -20,6 +20,16 @@ namespace GeoLocation
         tzset();
     }
 
+    // Читает ровно count десятичных цифр, -1 если встретилась не цифра
+    static int parseDigits(const char* p, int count) {
+        int value = 0;
+        for (int i = 0; i < count; i++) {
+            if (p[i] < '0' || p[i] > '9') return -1;
+            value = value * 10 + (p[i] - '0');
+        }
+        return value;
+    }
+
     const char * stateToStr(const State s){
         switch(s){
             case State::Idle: return "Idle"; 
@@ -91,6 +101,7 @@ namespace GeoLocation
     
         _linesReceived = 0;
         _currentLine = "";
+        _currentLine.reserve(LINE_BUFFER_SIZE); // строка переиспользуется, без переаллокаций на каждый символ
         _headersParsed = false;
         _httpDateSet = false;
         
@@ -224,16 +235,19 @@ namespace GeoLocation
     
     void GeoLocation::sendHttpRequest()
 {
-    String request = "GET /line/?fields=country,city,lat,lon,timezone,offset,query";
+    String request;
+    request.reserve(128); // весь запрос собирается в одном буфере без переаллокаций
+    request = "GET /line/?fields=country,city,lat,lon,timezone,offset,query";
     if (_language.length() == 2)
     {
         request += "&lang=";
         request += _language;
     }
-    request += " HTTP/1.1\r\n";
-    request += "Host: ip-api.com\r\n";
-    request += "Connection: close\r\n";
-    request += "\r\n";
+    // Неизменяемый хвост запроса склеивается на этапе компиляции
+    request += " HTTP/1.1\r\n"
+               "Host: ip-api.com\r\n"
+               "Connection: close\r\n"
+               "\r\n";
     
     _client.print(request);
 }
@@ -241,10 +255,19 @@ namespace GeoLocation
 // устанавливает State::Parsing или State::Error
 void GeoLocation::processResponse()
 {
-    // Читаем данные, если они есть
-    while (_client.available())
+    // Читаем данные блоками в буфер на стеке, если они есть
+    uint8_t buf[64];
+    int len = 0;
+    int pos = 0;
+    while (pos < len || _client.available())
     {
-        char c = _client.read();
+        if (pos == len)
+        {
+            len = _client.read(buf, sizeof(buf));
+            pos = 0;
+            if (len <= 0) break;
+        }
+        char c = buf[pos++];
         
         if (c == '\n')
         {
@@ -263,7 +286,10 @@ void GeoLocation::processResponse()
                     // Ищем заголовок Date
                     if (_useHttpTime && !_httpDateSet && _currentLine.startsWith("Date:"))
                     {
-                        auto httpTime = parseHttpDate(_currentLine.substring(6));
+                        // Значение после "Date:", пробелы после двоеточия необязательны
+                        const char* dateValue = _currentLine.c_str() + 5;
+                        while (*dateValue == ' ' || *dateValue == '\t') dateValue++;
+                        auto httpTime = parseHttpDate(dateValue);
                         if ( httpTime > LIKE_VALID_TIME ){
 
                             setSystemTime(httpTime, ( httpCorrectionMs + _executionTime)*1000 );
@@ -395,28 +421,31 @@ void GeoLocation::processResponse()
         }
     }
     
-    time_t GeoLocation::parseHttpDate(const String& httpDate) const
+    time_t GeoLocation::parseHttpDate(const char* httpDate) const
     {
         time_t httpTime = 0;
         //  надежный парсер HTTP-даты
-        const char* months[] = {"Jan", "Feb", "Mar", "Apr", "May", "Jun",
-                            "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"};
+        static const char* const months[] = {"Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                                           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"};
         
         struct tm tm = {0};
-        char monthStr[4] = {0};
-        
-        // Парсим строку формата "Mon, 25 Dec 2023 14:30:45 GMT"
-        int parsed = sscanf(httpDate.c_str(), 
-                        "%*3s, %d %3s %d %d:%d:%d",
-                        &tm.tm_mday, monthStr, &tm.tm_year,
-                        &tm.tm_hour, &tm.tm_min, &tm.tm_sec);
         
-        if (parsed == 6)
+        // Строка фиксированного формата "Mon, 25 Dec 2023 14:30:45 GMT",
+        // поэтому поля читаются по смещениям без sscanf
+        if (strnlen(httpDate, 25) == 25 &&
+            httpDate[3] == ',' && httpDate[4] == ' ' && httpDate[7] == ' ' &&
+            httpDate[11] == ' ' && httpDate[16] == ' ' &&
+            httpDate[19] == ':' && httpDate[22] == ':' &&
+            (tm.tm_mday = parseDigits(httpDate + 5, 2)) >= 0 &&
+            (tm.tm_year = parseDigits(httpDate + 12, 4)) >= 0 &&
+            (tm.tm_hour = parseDigits(httpDate + 17, 2)) >= 0 &&
+            (tm.tm_min = parseDigits(httpDate + 20, 2)) >= 0 &&
+            (tm.tm_sec = parseDigits(httpDate + 23, 2)) >= 0)
         {
             // Находим месяц
             for (int i = 0; i < 12; i++)
             {
-                if (strncmp(monthStr, months[i], 3) == 0)
+                if (strncmp(httpDate + 8, months[i], 3) == 0)
                 {
                     tm.tm_mon = i;
                     break;
@@ -24,6 +24,7 @@ namespace GeoLocation
     static const size_t COUNTRY_SIZE = 32;
     static const size_t CITY_SIZE = 64;
     static const size_t TIMEZONE_SIZE = 48;
+    static const size_t LINE_BUFFER_SIZE = 128; // строка ответа/заголовка HTTP
     static const time_t LIKE_VALID_TIME = 1609459200;
     static const long httpCorrectionMs = 900;
 
@@ -243,7 +244,7 @@ namespace GeoLocation
         void processResponse();
         //bool parseHttpHeaders();
         bool parseResponseLine(const String& line, int lineIndex);
-        time_t parseHttpDate(const String& httpDate) const;
+        time_t parseHttpDate(const char* httpDate) const;
         void setSystemTime(const time_t unixTime, const long usCorrections = 0);
         void _configTime();
         void completeRequest();